@@ -1,31 +1,92 @@
 """Home Assistant integration: Solar Eclipse."""
-from .const import DOMAIN
+from .const import DOMAIN, DEFAULT_NUM_EVENTS, DEFAULT_MIN_COVERAGE, DEFAULT_UPDATE_HOUR
+from .sensor import EclipseCoordinator, STORE_NAMES
+from homeassistant.helpers.storage import Store
 import os
 import shutil
 
+_PLATFORMS: tuple[str, ...] = ("sensor", "binary_sensor")
+_SENTINEL = object()
+# Options that can be applied to running entities without a reload
+_HOT_RELOAD_KEYS = frozenset({"update_hour"})
+
+def _remove_dir(path):
+    # Runs in executor thread; both the stat and the tree walk touch disk
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+
 async def async_setup(hass, config):
     """Set up the integration."""
     return True
 
 async def _update_listener(hass, entry):
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None:
+        new_config = {**entry.data, **entry.options}
+        last_config = coordinator.entry_config
+        changed = {k for k in new_config.keys() | last_config.keys() if new_config.get(k) != last_config.get(k)}
+        # Nothing changed, or only values entities can apply in place: skip the full reload
+        if changed <= _HOT_RELOAD_KEYS:
+            coordinator.entry_config = new_config
+            if "update_hour" in changed:
+                coordinator.async_set_update_hour(int(new_config["update_hour"]))
+            return
     await hass.config_entries.async_reload(entry.entry_id)
 
 async def async_setup_entry(hass, entry):
     """Set up from a config entry."""
+    def opt(key, default):
+        # Options override data; data is only consulted when the option is absent
+        value = entry.options.get(key, _SENTINEL)
+        return value if value is not _SENTINEL else entry.data.get(key, default)
+
+    install_skyfield = opt("install_skyfield", True)
+    latitude = opt("latitude", hass.config.latitude or 0.0)
+    longitude = opt("longitude", hass.config.longitude or 0.0)
+    region = opt("region", "Europe")
+    num_events = opt("num_events", DEFAULT_NUM_EVENTS)
+    min_coverage = opt("min_coverage", DEFAULT_MIN_COVERAGE)
+    update_hour = opt("update_hour", DEFAULT_UPDATE_HOUR)
+
+    # One coordinator per entry, shared by both platforms (single NASA fetch)
+    coordinator = EclipseCoordinator(
+        hass, install_skyfield, latitude, longitude, region, num_events, min_coverage,
+        entry_id=entry.entry_id, update_hour=update_hour,
+    )
+    await coordinator.async_load_stores()
+    # Load translations for current UI language (best effort)
+    ui_lang = getattr(hass.config, "language", None)
+    if isinstance(ui_lang, str) and ui_lang:
+        await coordinator.async_load_translations(ui_lang)
+    coordinator.entry_config = {**entry.data, **entry.options}
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    # Single daily trigger at update_hour for all entities of this entry
+    entry.async_on_unload(coordinator.async_start_daily_update())
+
     # Forward setup to sensor and binary_sensor platforms
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "binary_sensor"])
+    await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
     # Register options update listener once per entry
     entry.async_on_unload(entry.add_update_listener(_update_listener))
     return True
 
 async def async_unload_entry(hass, entry):
     """Unload config entry."""
-    ok = await hass.config_entries.async_unload_platforms(entry, ["sensor", "binary_sensor"])
+    ok = await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+    if ok:
+        domain_data = hass.data.get(DOMAIN, {})
+        coordinator = domain_data.pop(entry.entry_id, None)
+        domain_data.pop("ephemeris", None)
+        if coordinator is not None:
+            await coordinator.async_flush_stores()
     # Cleanup skyfield cache dir
     skyfield_dir = hass.config.path(".storage/solar_eclipse_skyfield")
     try:
-        if os.path.isdir(skyfield_dir):
-            shutil.rmtree(skyfield_dir, ignore_errors=True)
+        await hass.async_add_executor_job(_remove_dir, skyfield_dir)
     except Exception:
         pass
     return ok
+
+async def async_remove_entry(hass, entry):
+    """Remove the cached data of a deleted config entry."""
+    for name in STORE_NAMES:
+        await Store(hass, 1, f"{DOMAIN}_{name}").async_remove()
@@ -1,26 +1,49 @@
+import re
+
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
-from .const import DOMAIN, SUPPORTED_REGIONS, DEFAULT_NUM_EVENTS, DEFAULT_UPDATE_HOUR, DEFAULT_MIN_COVERAGE
+from .const import DOMAIN, SUPPORTED_REGIONS, SUPPORTED_REGIONS_SET, DEFAULT_NUM_EVENTS, DEFAULT_UPDATE_HOUR, DEFAULT_MIN_COVERAGE
+
+# Pre-rendered "HH:00" labels for the 24 possible hours
+_HOUR_STRINGS = tuple(f"{h:02d}:00" for h in range(24))
+
+# Signed hour, optionally followed by ":MM", ":MM:SS" or anything else after a colon (ignored)
+_HOUR_RE = re.compile(r"^\s*([+-]?\d+)\s*(?::.*)?$")
+
+
+def _parse_hour(value) -> int:
+    m = _HOUR_RE.match(str(value))
+    if m is None:
+        return DEFAULT_UPDATE_HOUR
+    # Out-of-range hours are clamped, not replaced by the default
+    return max(0, min(23, int(m.group(1))))
+
+
+def _format_time(hour: int) -> str:
+    return _HOUR_STRINGS[max(0, min(23, int(hour)))]
+
+
+# Schemas whose defaults are constants are built once at import
+_REGION_VALIDATOR = vol.In(SUPPORTED_REGIONS)
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required("install_skyfield", default=True): bool,
+    vol.Required("num_events", default=DEFAULT_NUM_EVENTS): int,
+    vol.Required("update_hour", default=_format_time(DEFAULT_UPDATE_HOUR)): str,
+    vol.Required("min_coverage", default=DEFAULT_MIN_COVERAGE): int,
+})
+
+_REGION_SCHEMA = vol.Schema({
+    vol.Required("region", default="Europe"): _REGION_VALIDATOR,
+})
+
 
 class SolarEclipseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Solar Eclipse integration."""
 
     VERSION = 2
 
-    def _format_time(self, hour: int) -> str:
-        hour = max(0, min(23, int(hour)))
-        return f"{hour:02d}:00"
-
-    def _parse_hour(self, value) -> int:
-        try:
-            if isinstance(value, str) and ":" in value:
-                parts = value.split(":")
-                return max(0, min(23, int(parts[0])))
-            return max(0, min(23, int(value)))
-        except Exception:
-            return DEFAULT_UPDATE_HOUR
-
     async def async_step_user(self, user_input=None):
         # Enforce single instance
         if self._async_current_entries():
@@ -28,7 +51,7 @@ class SolarEclipseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             num_events = int(user_input.get("num_events", DEFAULT_NUM_EVENTS))
-            update_hour = self._parse_hour(user_input.get("update_hour", DEFAULT_UPDATE_HOUR))
+            update_hour = _parse_hour(user_input.get("update_hour", DEFAULT_UPDATE_HOUR))
             min_coverage = int(user_input.get("min_coverage", DEFAULT_MIN_COVERAGE))
             min_coverage = max(0, min(100, min_coverage))
             num_events = max(1, min(10, num_events))
@@ -43,13 +66,7 @@ class SolarEclipseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_coords()
             return await self.async_step_region()
 
-        schema = vol.Schema({
-            vol.Required("install_skyfield", default=True): bool,
-            vol.Required("num_events", default=DEFAULT_NUM_EVENTS): int,
-            vol.Required("update_hour", default=self._format_time(DEFAULT_UPDATE_HOUR)): str,
-            vol.Required("min_coverage", default=DEFAULT_MIN_COVERAGE): int,
-        })
-        return self.async_show_form(step_id="user", data_schema=schema)
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
     async def async_step_coords(self, user_input=None):
         if user_input is not None:
@@ -69,10 +86,7 @@ class SolarEclipseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data = {**getattr(self, "_data", {}), **user_input}
             return self.async_create_entry(title="Solar Eclipse", data=data)
 
-        schema = vol.Schema({
-            vol.Required("region", default="Europe"): vol.In(SUPPORTED_REGIONS),
-        })
-        return self.async_show_form(step_id="region", data_schema=schema)
+        return self.async_show_form(step_id="region", data_schema=_REGION_SCHEMA)
 
     @staticmethod
     @callback
@@ -85,19 +99,6 @@ class SolarEclipseOptionsFlow(config_entries.OptionsFlow):
         self.entry = entry
         self._opts = dict(entry.options) if entry.options else {}
 
-    def _format_time(self, hour: int) -> str:
-        hour = max(0, min(23, int(hour)))
-        return f"{hour:02d}:00"
-
-    def _parse_hour(self, value) -> int:
-        try:
-            if isinstance(value, str) and ":" in value:
-                parts = value.split(":")
-                return max(0, min(23, int(parts[0])))
-            return max(0, min(23, int(value)))
-        except Exception:
-            return DEFAULT_UPDATE_HOUR
-
     async def async_step_init(self, user_input=None):
         return await self.async_step_choice(user_input)
 
@@ -105,7 +106,7 @@ class SolarEclipseOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             install_skyfield = bool(user_input.get("install_skyfield", True))
             num_events = int(user_input.get("num_events", DEFAULT_NUM_EVENTS))
-            update_hour = self._parse_hour(user_input.get("update_hour", DEFAULT_UPDATE_HOUR))
+            update_hour = _parse_hour(user_input.get("update_hour", DEFAULT_UPDATE_HOUR))
             min_coverage = int(user_input.get("min_coverage", self._opts.get("min_coverage", DEFAULT_MIN_COVERAGE)))
             min_coverage = max(0, min(100, min_coverage))
             self._opts["install_skyfield"] = install_skyfield
@@ -123,7 +124,7 @@ class SolarEclipseOptionsFlow(config_entries.OptionsFlow):
         schema = vol.Schema({
             vol.Required("install_skyfield", default=bool(current)): bool,
             vol.Required("num_events", default=num_events): int,
-            vol.Required("update_hour", default=self._format_time(update_hour)): str,
+            vol.Required("update_hour", default=_format_time(update_hour)): str,
             vol.Required("min_coverage", default=min_coverage): int,
         })
         return self.async_show_form(step_id="choice", data_schema=schema)
@@ -155,7 +156,9 @@ class SolarEclipseOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="Options", data=self._opts)
 
         region_default = self._opts.get("region") or self.entry.data.get("region") or "Europe"
+        if region_default not in SUPPORTED_REGIONS_SET:
+            region_default = "Europe"
         schema = vol.Schema({
-            vol.Required("region", default=region_default): vol.In(SUPPORTED_REGIONS),
+            vol.Required("region", default=region_default): _REGION_VALIDATOR,
         })
         return self.async_show_form(step_id="region", data_schema=schema)
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 DOMAIN = "solar_eclipse"
 # Primary sources (decade pages) - try in order
 NASA_DECADE_URLS = [
@@ -9,16 +11,17 @@ NASA_DECADE_URLS = [
 ]
 JSEX_INDEX_URL = "https://eclipse.gsfc.nasa.gov/JSEX/JSEX-index.html"
 ATTRIBUTION = "Eclipse predictions by NASA/GSFC"
-SUPPORTED_REGIONS = ["Global", "Africa", "Asia", "Europe", "North America", "South America", "Oceania", "Antarctica"]
+SUPPORTED_REGIONS = ("Global", "Africa", "Asia", "Europe", "North America", "South America", "Oceania", "Antarctica")
+SUPPORTED_REGIONS_SET = frozenset(SUPPORTED_REGIONS)
 # Labels used on the JSEX index to identify region pages
-JSEX_REGION_LABELS = {
+JSEX_REGION_LABELS = MappingProxyType({
 	"Europe": "Europe",
 	"Africa": "Africa",
 	"Asia": "Asia and Asia Minor",
 	"North America": "North America",
 	"South America": "South America",
 	"Oceania": "Southeast Asia, Australia & Oceana",
-}
+})
 # Minimal fallback (used only if NASA pages are unavailable)
 ECLIPSE_FALLBACK = [
 	{"identifier": "2026-02-17", "type": "Annular", "time_utc": "17:00"},
@@ -1,35 +1,56 @@
 from __future__ import annotations
 
 import logging
+import html
+import math
+import os
 import re
 import asyncio
-from dataclasses import dataclass
+import random
+from bisect import bisect_left
+import time
+from importlib.util import find_spec
+from functools import lru_cache
+from operator import attrgetter
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone, date
 from typing import Any, List, Optional, Tuple
 
+import aiohttp
+
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.translation import async_get_translations
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     CoordinatorEntity,
 )
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, NASA_DECADE_URLS, ATTRIBUTION, SUPPORTED_REGIONS, JSEX_INDEX_URL, JSEX_REGION_LABELS, ECLIPSE_FALLBACK, DEFAULT_NUM_EVENTS, DEFAULT_UPDATE_HOUR, VERSION, DEFAULT_MIN_COVERAGE
+from .const import DOMAIN, NASA_DECADE_URLS, ATTRIBUTION, SUPPORTED_REGIONS_SET, JSEX_INDEX_URL, JSEX_REGION_LABELS, ECLIPSE_FALLBACK, DEFAULT_UPDATE_HOUR, VERSION
 
-# Optional Skyfield imports (declared in manifest requirements)
+# Optional Skyfield (declared in manifest requirements). Only its presence is checked here;
+# the heavy import runs in the executor on first use, see _import_skyfield()
 try:
-    from skyfield.api import load, wgs84, Loader
-    from math import acos, cos, sin
-    SKYFIELD_AVAILABLE = True
+    SKYFIELD_AVAILABLE = find_spec("skyfield") is not None and find_spec("numpy") is not None
 except Exception:  # pragma: no cover - fallback when not installed
     SKYFIELD_AVAILABLE = False
+np: Any = None
+wgs84: Any = None
+Loader: Any = None
+
+# Optional lxml for table row extraction; regex row splitting is used otherwise
+try:
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except Exception:  # pragma: no cover - fallback when not installed
+    LXML_AVAILABLE = False
 
 
 # Simple i18n maps for attribute values (best-effort; keys are not localized by HA)
@@ -114,7 +135,170 @@ def _t_type(hass: HomeAssistant, typ: Optional[str]) -> Optional[str]:
     lang = _attr_lang(hass)
     return _TYPE_I18N.get(lang, _TYPE_I18N["en"]).get(typ, typ)
 
-@dataclass
+_MONTH_MAP = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+_TYPE_MAP = {
+    "T": "Total",
+    "A": "Annular",
+    "P": "Partial",
+    "H": "Hybrid",
+    "Total": "Total",
+    "Annular": "Annular",
+    "Partial": "Partial",
+    "Hybrid": "Hybrid",
+}
+# NASA decade table parsing, compiled once
+# Eclipse fields on tag-free row text, where the cells read date, time, type
+_ECLIPSE_TEXT_RE = re.compile(r"(?P<year>20\d{2})\s+(?P<month>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(?P<day>\d{1,2})\s+(?P<time>\d{2}:\d{2})(?::\d{2})?\s+(?P<type>Total|Annular|Partial|Hybrid|[TAPH])\b", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+# Row starts and ends; either may be all there is, since HTML lets </tr> be omitted
+_ROW_BOUNDARY_RE = re.compile(r"<tr\b[^>]*>|</tr\s*>", re.IGNORECASE)
+# Region hint keywords, in priority order
+_REGION_KEYWORDS = {
+    "Africa": ["africa"],
+    "Asia": ["asia"],
+    "Europe": ["europe"],
+    "North America": ["north america", "usa", "united states", "canada", "mexico"],
+    "South America": ["south america"],
+    "Oceania": ["oceania", "australia", "new zealand"],
+    "Antarctica": ["antarctica"],
+}
+_REGION_KEYWORDS_ORDER = tuple(_REGION_KEYWORDS)
+_KEYWORD_PRIORITY = {
+    k: priority
+    for priority, keys in enumerate(_REGION_KEYWORDS.values())
+    for k in keys
+}
+_REGION_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in _KEYWORD_PRIORITY) + r")\b", re.IGNORECASE)
+# Dates on JSEX region pages, either "2026 Aug 12" or "12 Aug 2026"
+_JSEX_DATE_YMD_RE = re.compile(r"\b(\d{4})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})\b", re.IGNORECASE)
+_JSEX_DATE_DMY_RE = re.compile(r"\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})\b", re.IGNORECASE)
+
+def _region_page_dates(text: str) -> frozenset[str]:
+    """Collect the YYYY-MM-DD identifiers of all dates on a JSEX region page."""
+    found = set()
+    for y, mon, d in _JSEX_DATE_YMD_RE.findall(text):
+        found.add(f"{int(y):04d}-{_MONTH_MAP[mon.title()]:02d}-{int(d):02d}")
+    for d, mon, y in _JSEX_DATE_DMY_RE.findall(text):
+        found.add(f"{int(y):04d}-{_MONTH_MAP[mon.title()]:02d}-{int(d):02d}")
+    return frozenset(found)
+
+@lru_cache(maxsize=4096)
+def _extract_region_hint_cached(row_text: str) -> Optional[str]:
+    # Single scan for all keywords; the highest-priority region mentioned wins.
+    # Rows often repeat the same visibility text, so results are memoized.
+    best: Optional[int] = None
+    for m in _REGION_RE.finditer(row_text):
+        # Case-insensitive match; only the matched keyword is lowercased
+        priority = _KEYWORD_PRIORITY[m.group(1).lower()]
+        if best is None or priority < best:
+            best = priority
+    return _REGION_KEYWORDS_ORDER[best] if best is not None else None
+
+# JSEX index links: (href, label text)
+_JSEX_LINK_RE = re.compile(r"<a[^>]+href=\"([^\"]+)\"[^>]*>\s*([^<]+?)\s*<", re.IGNORECASE)
+_JSEX_BASE_URL = "https://eclipse.gsfc.nasa.gov/JSEX/"
+
+
+def _strip_tags(text: str) -> str:
+    """Plain text of an HTML fragment, with entities such as &nbsp; decoded."""
+    return html.unescape(_TAG_RE.sub(" ", text))
+
+def _iter_row_matches(text: str):
+    """Yield (match, row) for each table row on a NASA page that lists an eclipse."""
+    if LXML_AVAILABLE:
+        try:
+            tree = lxml_html.fromstring(text)
+        except Exception:
+            tree = None
+        if tree is not None:
+            for tr in tree.iter("tr"):
+                # Join cell text with spaces so adjacent cells stay separated
+                row = " ".join(tr.itertext())
+                m = _ECLIPSE_TEXT_RE.search(row)
+                if m:
+                    yield m, row
+            return
+    # Without lxml, tags are stripped once for the whole page, with row boundaries kept as NUL
+    # separators; the same plain row text feeds the parser and the region hint
+    plain = _strip_tags(_ROW_BOUNDARY_RE.sub("\0", text))
+    for row in plain.split("\0"):
+        for m in _ECLIPSE_TEXT_RE.finditer(row):
+            yield m, row
+
+# Fetch retries: full-jitter exponential backoff, 4xx are terminal except these
+_FETCH_ATTEMPTS = 4
+_FETCH_BACKOFF_BASE = 0.5
+_FETCH_BACKOFF_CAP = 10.0
+_RETRIABLE_4XX = frozenset({408, 425, 429})
+
+_SENTINEL = object()
+
+# Attribute time format (HH:MM in HA local timezone)
+_TIME_FMT = "%H:%M"
+
+_FETCH_HEADERS = {
+    "User-Agent": "HomeAssistant solar_eclipse integration (+https://github.com/matteoconti92/solar_eclipse)",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.7",
+}
+_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
+
+# Guards the one-time ephemeris load stored in hass.data[DOMAIN]["ephemeris"]
+_EPHEMERIS_LOCK = asyncio.Lock()
+# Persisted caches, stored under .storage/solar_eclipse_<name>
+STORE_NAMES: Tuple[str, ...] = ("events", "coverage", "region_dates")
+_STORE_SAVE_DELAY = 5
+
+# Apparent disk radii (radians) used by the lens-area coverage formula
+_PI = math.pi
+_SUN_R_RAD = (16.0 / 60.0) * _PI / 180.0
+_MOON_R_RAD = (15.5 / 60.0) * _PI / 180.0
+_SUN_R2 = _SUN_R_RAD * _SUN_R_RAD
+_MOON_R2 = _MOON_R_RAD * _MOON_R_RAD
+_SUN_AREA = _PI * _SUN_R2
+# Disks touch at R + r; at or below |R - r| the smaller disk lies fully inside the other
+_CONTACT_SEP_RAD = _SUN_R_RAD + _MOON_R_RAD
+_INSIDE_SEP_RAD = abs(_SUN_R_RAD - _MOON_R_RAD)
+_FULL_PERCENT = 100.0 * min(_SUN_R2, _MOON_R2) / _SUN_R2
+_FULL_COVERAGE = round(_FULL_PERCENT, 1)
+
+# Above this coarse-grid minimum separation no eclipse is possible; the margin covers
+# how much closer the true minimum can be between 10-minute samples
+_NO_ECLIPSE_SEP_RAD = _CONTACT_SEP_RAD + math.radians(6.0 / 60.0)
+
+def _import_skyfield() -> None:
+    """Bind Skyfield and NumPy to the module globals; blocking, call from the executor."""
+    global np, wgs84, Loader
+    import numpy
+    from skyfield.api import Loader as _Loader, wgs84 as _wgs84
+    np, wgs84, Loader = numpy, _wgs84, _Loader
+
+def _coverage_percent(d: float) -> float:
+    """Percent of the solar disk covered by the Moon at separation `d` (radians), rounded to 0.1."""
+    if d >= _CONTACT_SEP_RAD:
+        return 0.0
+    if d <= _INSIDE_SEP_RAD:
+        return _FULL_COVERAGE
+    d2 = d * d
+    alpha = 2 * math.acos(max(-1.0, min(1.0, (d2 + _SUN_R2 - _MOON_R2) / (2 * d * _SUN_R_RAD))))
+    beta = 2 * math.acos(max(-1.0, min(1.0, (d2 + _MOON_R2 - _SUN_R2) / (2 * d * _MOON_R_RAD))))
+    area = 0.5 * (_SUN_R2 * (alpha - math.sin(alpha)) + _MOON_R2 * (beta - math.sin(beta)))
+    return round(100.0 * area / _SUN_AREA, 1)
+
+def _coverage_percent_array(sep: "np.ndarray") -> "np.ndarray":
+    """Percent of the solar disk covered by the Moon for an array of separations (radians)."""
+    d = np.maximum(sep, 1e-12)
+    d2 = d * d
+    alpha = 2 * np.arccos(np.clip((d2 + _SUN_R2 - _MOON_R2) / (2 * d * _SUN_R_RAD), -1.0, 1.0))
+    beta = 2 * np.arccos(np.clip((d2 + _MOON_R2 - _SUN_R2) / (2 * d * _MOON_R_RAD), -1.0, 1.0))
+    area = 0.5 * (_SUN_R2 * (alpha - np.sin(alpha)) + _MOON_R2 * (beta - np.sin(beta)))
+    partial = 100.0 * area / _SUN_AREA
+    return np.where(sep >= _CONTACT_SEP_RAD, 0.0, np.where(sep <= _INSIDE_SEP_RAD, _FULL_PERCENT, partial))
+
+@dataclass(slots=True, frozen=True)
 class EclipseEvent:
     identifier: str
     date: datetime
@@ -122,10 +306,72 @@ class EclipseEvent:
     start: Optional[datetime]
     end: Optional[datetime]
     region_text: Optional[str] = None
+    # Localized `type`, filled in once per coordinator refresh
+    type_translated: Optional[str] = field(default=None, compare=False)
+    # Epoch seconds of `date`, cached for cheap comparisons
+    date_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "date_ts", self.date.timestamp())
+
+
+def _sort_by_date(events: List[EclipseEvent]) -> None:
+    """Sort events by date in place, skipping the sort when already ordered."""
+    if any(a.date_ts > b.date_ts for a, b in zip(events, events[1:])):
+        events.sort(key=attrgetter("date_ts"))
+
+def _event_to_dict(event: EclipseEvent) -> dict[str, Any]:
+    return {
+        "identifier": event.identifier,
+        "date": event.date.isoformat(),
+        "type": event.type,
+        "start": event.start.isoformat() if event.start else None,
+        "end": event.end.isoformat() if event.end else None,
+        "region_text": event.region_text,
+    }
+
+
+def _event_from_dict(item: dict[str, Any]) -> EclipseEvent:
+    start = item.get("start")
+    end = item.get("end")
+    return EclipseEvent(
+        identifier=item["identifier"],
+        date=datetime.fromisoformat(item["date"]),
+        type=item["type"],
+        start=datetime.fromisoformat(start) if start else None,
+        end=datetime.fromisoformat(end) if end else None,
+        region_text=item.get("region_text"),
+    )
+
+# Built-in event list used when neither NASA nor any cache is available
+_FALLBACK_EVENTS: Tuple[EclipseEvent, ...] = tuple(
+    EclipseEvent(
+        identifier=item["identifier"],
+        date=datetime(
+            *map(int, item["identifier"].split("-")),
+            *map(int, item["time_utc"].split(":")),
+            tzinfo=timezone.utc,
+        ),
+        type=item["type"],
+        start=None,
+        end=None,
+        region_text=None,
+    )
+    for item in sorted(ECLIPSE_FALLBACK, key=lambda item: (item["identifier"], item["time_utc"]))
+)
+
 
+def _next_daily_utc(hour: int) -> datetime:
+    """Next occurrence of `hour`:00 in HA local time, as UTC."""
+    now = dt_util.now()
+    target = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    # Small slack so a timer firing a hair early does not re-arm for the same hour
+    if target <= now + timedelta(seconds=1):
+        target += timedelta(days=1)
+    return dt_util.as_utc(target)
 
 class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
-    def __init__(self, hass: HomeAssistant, install_skyfield: bool, latitude: float, longitude: float, region: str, num_events: int, min_coverage: int):
+    def __init__(self, hass: HomeAssistant, install_skyfield: bool, latitude: float, longitude: float, region: str, num_events: int, min_coverage: int, entry_id: str, update_hour: int = DEFAULT_UPDATE_HOUR):
         super().__init__(
             hass,
             logger=logging.getLogger(__name__),
@@ -135,21 +381,58 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
         self.install_skyfield = install_skyfield
         self.latitude = latitude
         self.longitude = longitude
-        self.region = region if region in SUPPORTED_REGIONS else "Global"
+        self.region = region if region in SUPPORTED_REGIONS_SET else "Global"
         self.num_events = max(1, min(10, int(num_events)))
         self.min_coverage = max(0.0, min(100.0, float(min_coverage)))
+        # One device per entry, shared by every entity on both platforms
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name="Solar Eclipse",
+            manufacturer="Eclipse predictions by NASA/GSFC",
+            model="Solar Eclipse Advanced",
+            sw_version=VERSION,
+        )
         self._ephemeris = None
-        # In-memory cache (24h TTL)
+        # In-memory cache (24h TTL), mirrored to HA storage to survive restarts
         self._cache_events: Optional[List[EclipseEvent]] = None
-        self._cache_timestamp: Optional[datetime] = None
-        self._cache_ttl = timedelta(hours=24)
+        self._cache_timestamp: Optional[float] = None
+        self._cache_ttl = 24 * 3600.0
+        # Persisted caches, loaded once by async_load_stores at entry setup
+        self._stores: dict[str, Store] = {name: Store(hass, 1, f"{DOMAIN}_{name}") for name in STORE_NAMES}
+        # Local-maximum results keyed by "event time|lat|lon"
+        self._coverage_cache: dict[str, Any] = {}
+        # Parsed JSEX page dates per region
+        self._region_dates_cache: dict[str, Any] = {}
+        # JSEX index label -> page URL, with the time it was parsed
+        self._jsex_urls: Optional[Tuple[float, dict[str, str]]] = None
         # Dedicated Skyfield data directory under HA storage
         self.skyfield_dir = hass.config.path(".storage/solar_eclipse_skyfield")
-        # Limit concurrent Skyfield computations (CPU/RAM)
-        self._sf_semaphore = asyncio.Semaphore(3)
+        # Limit concurrent Skyfield computations (CPU/RAM); more than one per core only adds contention
+        self._sf_semaphore = asyncio.Semaphore(min(3, os.cpu_count() or 1))
+        # Limit concurrent page fetches to the NASA host
+        self._fetch_sem = asyncio.Semaphore(4)
         # Loaded UI translations for value localization
         self._translations: dict[str, str] = {}
         self._lang: Optional[str] = None
+        # Current UTC date, re-derived only once the clock passes the next UTC midnight
+        self._today_utc: date = date.min
+        self._today_until_ts = 0.0
+        # Localized region label per (region, attribute language)
+        self._region_labels: dict[Tuple[str, str], Optional[str]] = {}
+        # Current events in date order, with their epoch seconds for bisect lookups
+        self._event_ts: List[float] = []
+        self._events_by_date: List[EclipseEvent] = []
+        # Effective entry config (data + options) this coordinator was built from
+        self.entry_config: dict[str, Any] = {}
+        # Daily listener notification at the configured hour (HA local time)
+        self.update_hour = int(update_hour)
+        self._unsub_daily: Optional[CALLBACK_TYPE] = None
+        # Skyfield attributes per (identifier, lat, lon, UTC day), shared by all entities
+        self._local_attrs_cache: dict[Tuple[str, float, float, date], dict[str, Any]] = {}
+        # In-flight computations per key, so concurrent callers share one result
+        self._local_attrs_pending: dict[Tuple[str, float, float, date], asyncio.Future] = {}
+        # Skyfield bodies and observer per (lat, lon); the location is fixed per entry
+        self._sky_contexts: dict[Tuple[float, float], Tuple[Any, ...]] = {}
 
     async def async_load_translations(self, lang: str) -> None:
         try:
@@ -158,6 +441,42 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
         except Exception:
             self._translations = {}
             self._lang = None
+        self._region_labels.clear()
+
+    @callback
+    def async_start_daily_update(self) -> CALLBACK_TYPE:
+        """Notify listeners once a day at update_hour; return a callback that stops it."""
+        self._schedule_daily_update()
+        return self._async_stop_daily_update
+
+    @callback
+    def _schedule_daily_update(self) -> None:
+        # One timer for all entities, re-armed on fire
+        self._unsub_daily = async_track_point_in_utc_time(
+            self.hass, self._handle_daily_update, _next_daily_utc(self.update_hour)
+        )
+
+    @callback
+    def _handle_daily_update(self, now: datetime) -> None:
+        self._schedule_daily_update()
+        # Drop local attributes of previous days; entities recompute on the listener update
+        today = self.today_utc
+        self._local_attrs_cache = {k: v for k, v in self._local_attrs_cache.items() if k[3] == today}
+        self.async_update_listeners()
+
+    @callback
+    def _async_stop_daily_update(self) -> None:
+        if self._unsub_daily:
+            self._unsub_daily()
+            self._unsub_daily = None
+
+    @callback
+    def async_set_update_hour(self, hour: int) -> None:
+        """Move the daily update to a new hour without reloading the entry."""
+        self.update_hour = int(hour)
+        if self._unsub_daily:
+            self._unsub_daily()
+            self._schedule_daily_update()
 
     def translate_value(self, category: str, value: Optional[str]) -> Optional[str]:
         if not value:
@@ -166,8 +485,28 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
         key = f"component.{DOMAIN}.attr.{category}.{value}"
         return self._translations.get(key, value)
 
+    @property
+    def today_utc(self) -> date:
+        """Current UTC date, shared by the coordinator and its entities."""
+        now_ts = time.time()
+        if now_ts >= self._today_until_ts:
+            today = datetime.fromtimestamp(now_ts, timezone.utc).date()
+            self._today_utc = today
+            self._today_until_ts = datetime(today.year, today.month, today.day, tzinfo=timezone.utc).timestamp() + 86400
+        return self._today_utc
+
+    def get_translated_region(self, hass: HomeAssistant) -> Optional[str]:
+        """Return the configured region localized for attributes, memoized per language."""
+        key = (self.region, _attr_lang(hass))
+        try:
+            return self._region_labels[key]
+        except KeyError:
+            label = self._region_labels[key] = _t_region(hass, self.translate_value("region", self.region))
+            return label
+
     def _load_ephemeris_sync(self):
         # Runs in executor thread; uses dedicated directory
+        _import_skyfield()
         loader = Loader(self.skyfield_dir)
         ts = loader.timescale()
         eph = loader("de421.bsp")
@@ -177,81 +516,111 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
         if not self.install_skyfield or not SKYFIELD_AVAILABLE or self._ephemeris is not None:
             return
         try:
-            # Load ephemeris in background thread to avoid blocking
-            self.logger.info("Loading Skyfield ephemeris (de421) in background...")
-            self._ephemeris = await self.hass.async_add_executor_job(self._load_ephemeris_sync)
-            self.logger.info("Skyfield ephemeris loaded (de421).")
+            # One parsed ephemeris, kept in hass.data until the entry unloads
+            async with _EPHEMERIS_LOCK:
+                domain_data = self.hass.data.setdefault(DOMAIN, {})
+                ephemeris = domain_data.get("ephemeris")
+                if ephemeris is None:
+                    # Load ephemeris in background thread to avoid blocking
+                    self.logger.info("Loading Skyfield ephemeris (de421) in background...")
+                    ephemeris = await self.hass.async_add_executor_job(self._load_ephemeris_sync)
+                    domain_data["ephemeris"] = ephemeris
+                    self.logger.info("Skyfield ephemeris loaded (de421).")
+            self._ephemeris = ephemeris
         except Exception as err:
             self._ephemeris = None
             self.logger.warning("Skyfield ephemeris load failed: %s", err)
 
-    def _cache_set(self, events: List[EclipseEvent]) -> None:
+    def _cache_set(self, events: List[EclipseEvent], now_ts: float) -> None:
         self._cache_events = list(events)
-        self._cache_timestamp = datetime.now(timezone.utc)
+        self._cache_timestamp = now_ts
 
-    def _cache_get(self) -> Optional[List[EclipseEvent]]:
+    def _cache_get(self, now_ts: float, allow_stale: bool = False) -> Optional[List[EclipseEvent]]:
         if self._cache_events and self._cache_timestamp:
-            if datetime.now(timezone.utc) - self._cache_timestamp <= self._cache_ttl:
+            if allow_stale or now_ts - self._cache_timestamp <= self._cache_ttl:
                 return list(self._cache_events)
         return None
 
+    async def _async_load_store(self, name: str) -> dict[str, Any]:
+        try:
+            return await self._stores[name].async_load() or {}
+        except Exception as err:
+            self.logger.debug("Ignoring unreadable %s cache: %s", name, err)
+            return {}
+
+    async def async_load_stores(self) -> None:
+        """Seed the in-memory caches from HA storage; called once at entry setup."""
+        data = await self._async_load_store("events")
+        try:
+            events = [_event_from_dict(item) for item in data.get("events", [])]
+            if events:
+                self._cache_events = events
+                self._cache_timestamp = float(data["ts"])
+        except Exception as err:
+            self.logger.debug("Ignoring unreadable stored events: %s", err)
+        data = await self._async_load_store("coverage")
+        # Drop entries for events that are long gone
+        cutoff = time.time() - 86400
+        try:
+            self._coverage_cache = {
+                k: v for k, v in data.items() if datetime.fromisoformat(k.split("|", 1)[0]).timestamp() > cutoff
+            }
+        except Exception as err:
+            self.logger.debug("Ignoring unreadable coverage cache: %s", err)
+        self._region_dates_cache = await self._async_load_store("region_dates")
+
+    async def async_flush_stores(self) -> None:
+        """Write pending cache changes now; called when the entry unloads."""
+        await self._stores["coverage"].async_save(self._coverage_cache)
+        await self._stores["region_dates"].async_save(self._region_dates_cache)
+
+    async def _async_save_cache(self) -> None:
+        try:
+            await self._stores["events"].async_save({
+                "ts": self._cache_timestamp,
+                "events": [_event_to_dict(e) for e in self._cache_events or []],
+            })
+        except Exception as err:
+            self.logger.debug("Storing events failed: %s", err)
+
     async def _async_fetch_text(self, url: str) -> Optional[str]:
-        session = async_get_clientsession(self.hass)
-        headers = {
-            "User-Agent": "HomeAssistant solar_eclipse integration (+https://github.com/matteoconti92/solar_eclipse)",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.7",
-        }
-        delay = 1.0
-        for attempt in range(3):
+        for attempt in range(_FETCH_ATTEMPTS):
             try:
-                async with session.get(url, timeout=10, headers=headers) as resp:
-                    if resp.status != 200:
-                        self.logger.debug("Fetch %s returned HTTP %s (attempt %s)", url, resp.status, attempt + 1)
-                        raise RuntimeError(f"HTTP {resp.status}")
-                    return await resp.text()
+                async with async_get_clientsession(self.hass).get(
+                    url, headers=_FETCH_HEADERS, timeout=_FETCH_TIMEOUT
+                ) as resp:
+                    if resp.status == 200:
+                        return await resp.text()
+                    self.logger.debug("Fetch %s returned HTTP %s (attempt %s)", url, resp.status, attempt + 1)
+                    if 400 <= resp.status < 500 and resp.status not in _RETRIABLE_4XX:
+                        return None
+                    raise RuntimeError(f"HTTP {resp.status}")
             except Exception as err:
                 self.logger.debug("Fetch failed %s: %s (attempt %s)", url, err, attempt + 1)
-                if attempt < 2:
-                    await asyncio.sleep(delay)
-                    delay *= 2
+                if attempt < _FETCH_ATTEMPTS - 1:
+                    await asyncio.sleep(random.uniform(0, min(_FETCH_BACKOFF_CAP, _FETCH_BACKOFF_BASE * 2 ** attempt)))
         return None
 
     async def _async_fetch_nasa(self) -> List[EclipseEvent]:
         events: List[EclipseEvent] = []
-        month_map = {
-            "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
-            "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
-        }
-        type_map = {
-            "T": "Total",
-            "A": "Annular",
-            "P": "Partial",
-            "H": "Hybrid",
-            "Total": "Total",
-            "Annular": "Annular",
-            "Partial": "Partial",
-            "Hybrid": "Hybrid",
-        }
-        pattern = re.compile(r"(20\d{2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}).{0,120}?(Total|Annular|Partial|Hybrid|[TAPH]).{0,120}?(\d{2}:\d{2})", re.IGNORECASE | re.DOTALL)
-        row_pattern = re.compile(r"<tr[\s\S]*?>[\s\S]*?<\/tr>", re.IGNORECASE)
 
-        for url in NASA_DECADE_URLS:
-            text = await self._async_fetch_text(url)
+        async def _fetch_one(url: str) -> Tuple[str, Optional[str]]:
+            async with self._fetch_sem:
+                return url, await self._async_fetch_text(url)
+
+        # Fetch all decade pages concurrently; parse in the original URL order
+        results = await asyncio.gather(*(_fetch_one(u) for u in NASA_DECADE_URLS))
+        for url, text in results:
             if not text:
                 continue
-            rows = row_pattern.findall(text)
-            for row in rows:
-                match = pattern.search(row)
-                if not match:
-                    continue
-                year = int(match.group(1))
-                mon_txt = match.group(2).title()
-                day = int(match.group(3))
-                typ_raw = match.group(4)
-                time_txt = match.group(5)
-                month = month_map.get(mon_txt)
-                typ = type_map.get(typ_raw.title(), type_map.get(typ_raw.upper(), "Partial"))
+            for match, row in _iter_row_matches(text):
+                year = int(match.group("year"))
+                mon_txt = match.group("month").title()
+                day = int(match.group("day"))
+                typ_raw = match.group("type")
+                time_txt = match.group("time")
+                month = _MONTH_MAP.get(mon_txt)
+                typ = _TYPE_MAP.get(typ_raw.title(), _TYPE_MAP.get(typ_raw.upper(), "Partial"))
                 try:
                     hour, minute = [int(x) for x in time_txt.split(":", 1)]
                     dt = datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
@@ -262,14 +631,14 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
                 events.append(EclipseEvent(identifier=identifier, date=dt, type=typ, start=None, end=None, region_text=region_hint))
             # Also fallback to whole page scan for this decade
             if not events:
-                for match in pattern.finditer(text):
-                    year = int(match.group(1))
-                    mon_txt = match.group(2).title()
-                    day = int(match.group(3))
-                    typ_raw = match.group(4)
-                    time_txt = match.group(5)
-                    month = month_map.get(mon_txt)
-                    typ = type_map.get(typ_raw.title(), type_map.get(typ_raw.upper(), "Partial"))
+                for match in _ECLIPSE_TEXT_RE.finditer(_strip_tags(text)):
+                    year = int(match.group("year"))
+                    mon_txt = match.group("month").title()
+                    day = int(match.group("day"))
+                    typ_raw = match.group("type")
+                    time_txt = match.group("time")
+                    month = _MONTH_MAP.get(mon_txt)
+                    typ = _TYPE_MAP.get(typ_raw.title(), _TYPE_MAP.get(typ_raw.upper(), "Partial"))
                     try:
                         hour, minute = [int(x) for x in time_txt.split(":", 1)]
                         dt = datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
@@ -277,88 +646,123 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
                         dt = datetime(year, month, day, 0, 0, tzinfo=timezone.utc)
                     identifier = f"{year:04d}-{month:02d}-{day:02d}"
                     events.append(EclipseEvent(identifier=identifier, date=dt, type=typ, start=None, end=None, region_text=None))
-        # Dedup and sort
+        # Dedup (earliest listing wins); pages are in date order, so this rarely needs a sort
         if events:
-            uniq = {}
+            uniq: dict[str, EclipseEvent] = {}
             for e in events:
-                if e.identifier not in uniq or e.date < uniq[e.identifier].date:
+                prev = uniq.get(e.identifier)
+                if prev is None or e.date < prev.date:
                     uniq[e.identifier] = e
             events = list(uniq.values())
-            events.sort(key=lambda e: e.date)
+            _sort_by_date(events)
         return events
 
     def _extract_region_hint(self, row_text: str) -> Optional[str]:
-        text = row_text.lower()
-        region_keywords = {
-            "Africa": ["africa"],
-            "Asia": ["asia"],
-            "Europe": ["europe"],
-            "North America": ["north america", "usa", "united states", "canada", "mexico"],
-            "South America": ["south america"],
-            "Oceania": ["oceania", "australia", "new zealand"],
-            "Antarctica": ["antarctica"],
-        }
-        for region, keys in region_keywords.items():
-            for k in keys:
-                if k in text:
-                    return region
-        return None
-
-    async def _async_visible_in_region(self, identifier: str) -> bool:
+        return _extract_region_hint_cached(row_text)
+
+    async def _async_region_url(self, label: str) -> Optional[str]:
+        """Return the JSEX page URL for a region label, parsing the index at most once a day."""
+        cached = self._jsex_urls
+        if cached is None or time.time() - cached[0] >= self._cache_ttl:
+            index_text = await self._async_fetch_text(JSEX_INDEX_URL)
+            if not index_text:
+                return None
+            urls: dict[str, str] = {}
+            for href, text in _JSEX_LINK_RE.findall(index_text):
+                # First link per label wins; relative links resolve against the JSEX directory
+                urls.setdefault(text.lower(), href if href.startswith("http") else _JSEX_BASE_URL + href.lstrip("./"))
+            cached = self._jsex_urls = (time.time(), urls)
+        return cached[1].get(label.lower())
+
+    async def _async_region_dates(self) -> Optional[frozenset[str]]:
+        """Return identifiers of eclipses listed on the region's JSEX page, or None if unknown."""
         if self.region == "Global":
-            return True
-        index_text = await self._async_fetch_text(JSEX_INDEX_URL)
-        if not index_text:
-            return True
+            return None
         label = JSEX_REGION_LABELS.get(self.region)
         if not label:
-            return True
-        m = re.search(rf"<a[^>]+href=\"([^\"]+)\"[^>]*>\s*{re.escape(label)}\s*<", index_text, re.IGNORECASE)
-        if not m:
-            return True
-        href = m.group(1)
-        if not href.startswith("http"):
-            base = "https://eclipse.gsfc.nasa.gov/JSEX/"
-            url = base + href.lstrip("./")
-        else:
-            url = href
+            return None
+        # The JSEX pages change rarely; reuse the parsed dates for 24h, also across restarts
+        cache = self._region_dates_cache
+        cached = cache.get(self.region)
+        if cached and time.time() - cached["ts"] < self._cache_ttl:
+            return frozenset(cached["dates"])
+        url = await self._async_region_url(label)
+        if not url:
+            return None
         region_text = await self._async_fetch_text(url)
         if not region_text:
-            return True
-        y, mth, d = identifier.split("-")
-        month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        try:
-            mon_txt = month_names[int(mth) - 1]
-        except Exception:
-            mon_txt = mth
-        p1 = re.compile(rf"{y}\s+{mon_txt}\s+{int(d)}", re.IGNORECASE)
-        p2 = re.compile(rf"{int(d)}\s+{mon_txt}\s+{y}", re.IGNORECASE)
-        return bool(p1.search(region_text) or p2.search(region_text))
+            return None
+        dates = _region_page_dates(region_text)
+        cache[self.region] = {"ts": time.time(), "dates": sorted(dates)}
+        self._stores["region_dates"].async_delay_save(lambda: cache, _STORE_SAVE_DELAY)
+        return dates
+
+    def _next_event_entry(self, now_ts: float) -> Tuple[float, Optional[EclipseEvent]]:
+        idx = bisect_left(self._event_ts, now_ts)
+        if idx < len(self._event_ts):
+            return self._event_ts[idx], self._events_by_date[idx]
+        return float("inf"), None
+
+    def next_event(self) -> Optional[EclipseEvent]:
+        """Return the next upcoming event, if any."""
+        return self._next_event_entry(time.time())[1]
+
+    def next_event_within(self, seconds: float) -> bool:
+        """Return True if the next upcoming event starts within `seconds` from now."""
+        now_ts = time.time()
+        return self._next_event_entry(now_ts)[0] <= now_ts + seconds
 
     async def _async_update_data(self) -> List[EclipseEvent]:
+        events = [
+            replace(e, type_translated=_t_type(self.hass, self.translate_value("type", e.type)))
+            for e in await self._async_compute_events()
+        ]
+        # Drop local attributes of events that left the list or of previous days
+        ids = {e.identifier for e in events}
+        today = self.today_utc
+        self._local_attrs_cache = {k: v for k, v in self._local_attrs_cache.items() if k[0] in ids and k[3] == today}
+        # Results are already in date order; this only guards the bisect invariant
+        _sort_by_date(events)
+        self._events_by_date = events
+        self._event_ts = [e.date_ts for e in events]
+        return events
+
+    async def _async_compute_events(self) -> List[EclipseEvent]:
+        # Without Skyfield the region page decides visibility; fetch it alongside the NASA pages
+        region_task: Optional[asyncio.Task] = None
+        if not (self.install_skyfield and SKYFIELD_AVAILABLE) and self.region != "Global":
+            region_task = asyncio.create_task(self._async_region_dates())
+        try:
+            return await self._async_select_events(region_task)
+        finally:
+            if region_task is not None:
+                # Also retrieves the error of a lookup that failed but was never awaited
+                region_task.cancel()
+                await asyncio.gather(region_task, return_exceptions=True)
+
+    async def _async_select_events(self, region_task: Optional[asyncio.Task]) -> List[EclipseEvent]:
         await self._async_setup_skyfield()
-        nasa_events = await self._async_fetch_nasa()
+        now_ts = time.time()
+        nasa_events = self._cache_get(now_ts)
         if nasa_events:
-            self._cache_set(nasa_events)
-            self.logger.info("Loaded %s events from SEfuture.", len(nasa_events))
+            self.logger.info("Using cached SEfuture events (%s items).", len(nasa_events))
         else:
-            cached = self._cache_get()
+            nasa_events = await self._async_fetch_nasa()
+            if nasa_events:
+                self._cache_set(nasa_events, now_ts)
+                await self._async_save_cache()
+                self.logger.info("Loaded %s events from SEfuture.", len(nasa_events))
+        if not nasa_events:
+            cached = self._cache_get(now_ts, allow_stale=True)
             if cached:
-                self.logger.info("Using cached SEfuture events (%s items).", len(cached))
+                self.logger.info("Using stale cached SEfuture events (%s items).", len(cached))
                 nasa_events = cached
             else:
                 self.logger.warning("No SEfuture data and no cache; using minimal fallback list.")
-                tmp: List[EclipseEvent] = []
-                for item in ECLIPSE_FALLBACK:
-                    y, m, d = [int(x) for x in item["identifier"].split("-")]
-                    hh, mm = [int(x) for x in item["time_utc"].split(":")]
-                    dt = datetime(y, m, d, hh, mm, tzinfo=timezone.utc)
-                    tmp.append(EclipseEvent(identifier=item["identifier"], date=dt, type=item["type"], start=None, end=None, region_text=None))
-                nasa_events = tmp
-
-        now = datetime.now(timezone.utc)
-        future = [e for e in nasa_events if e.date > now]
-        future.sort(key=lambda e: e.date)
+                nasa_events = list(_FALLBACK_EVENTS)
+
+        # Every source (fetch, cache, fallback) is already in date order
+        future = [e for e in nasa_events if e.date_ts > now_ts]
 
         if self.install_skyfield and SKYFIELD_AVAILABLE and self._ephemeris is not None:
             lat = float(self.latitude)
@@ -373,29 +777,49 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
                         self.logger.debug("Local max calc failed for %s: %s", evt.identifier, err)
                         return 0.0
 
-            # Scan future events until num_events visible are found (>= configured coverage)
+            async def indexed_cov(idx: int, evt: EclipseEvent) -> Tuple[int, Optional[float]]:
+                return idx, await local_max_cov(evt)
+
+            # Scan future events until num_events visible are found (>= configured coverage).
+            # All events are queued at once behind _sf_semaphore; results are consumed as they
+            # complete but only accepted in date order, so the earliest visible events win.
             visible: List[EclipseEvent] = []
-            batch_size = 25
-            max_scan = len(future)
             self.logger.info("Filtering eclipses with >= %.1f%% coverage from %d future events", self.min_coverage, len(future))
-            for start_idx in range(0, max_scan, batch_size):
-                batch = future[start_idx:start_idx + batch_size]
-                if not batch:
-                    break
-                coverages = await asyncio.gather(*(local_max_cov(e) for e in batch), return_exceptions=False)
-                for e, c in zip(batch, coverages):
-                    if c and c >= self.min_coverage:  # Filter eclipses with >= configured coverage
-                        visible.append(e)
-                        if len(visible) >= self.num_events:
-                            self.logger.info("Found %d eclipses with >= %.1f%% coverage (requested: %d)", len(visible), self.min_coverage, self.num_events)
-                            return visible[: self.num_events]
+            tasks = [asyncio.create_task(indexed_cov(i, e)) for i, e in enumerate(future)]
+            coverages: List[Any] = [_SENTINEL] * len(future)
+            next_idx = 0
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    idx, cov = await next_done
+                    coverages[idx] = cov
+                    while next_idx < len(future) and coverages[next_idx] is not _SENTINEL:
+                        c = coverages[next_idx]
+                        if c and c >= self.min_coverage:  # Filter eclipses with >= configured coverage
+                            visible.append(future[next_idx])
+                        next_idx += 1
+                    if len(visible) >= self.num_events:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
             self.logger.info("Found %d eclipses with >= %.1f%% coverage (requested: %d)", len(visible), self.min_coverage, self.num_events)
             return visible[: self.num_events]
 
         if future:
             try:
-                vis_flags = await asyncio.gather(*(self._async_visible_in_region(e.identifier) for e in future))
-                region_visible = [e for e, ok in zip(future, vis_flags) if ok]
+                # Rows whose own region hint names the region need no lookup; otherwise one page
+                # lookup per refresh (only if reached), then a set test per event
+                dates: Any = _SENTINEL
+                region_visible: List[EclipseEvent] = []
+                for e in future:
+                    if e.region_text != self.region:
+                        if dates is _SENTINEL:
+                            dates = await (region_task if region_task is not None else self._async_region_dates())
+                        if dates is not None and e.identifier not in dates:
+                            continue
+                    region_visible.append(e)
+                    if len(region_visible) >= self.num_events:
+                        break
                 if region_visible:
                     return region_visible[: self.num_events]
                 self.logger.info("No events matched region filter; falling back to first 3 future events.")
@@ -408,76 +832,143 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
     async def async_calculate_coverage_percent(self, when: datetime, lat: float, lon: float) -> Optional[float]:
         if not (self.install_skyfield and SKYFIELD_AVAILABLE and self._ephemeris is not None):
             return None
-        ts, eph = self._ephemeris
-        t = ts.from_datetime(when)
-        earth = eph["earth"]
-        sun = eph["sun"]
-        moon = eph["moon"]
-        observer = earth + wgs84.latlon(latitude_degrees=lat, longitude_degrees=lon)
-        astrometric_sun = observer.at(t).observe(sun).apparent()
-        astrometric_moon = observer.at(t).observe(moon).apparent()
-        sep_rad = astrometric_sun.separation_from(astrometric_moon).radians
-        sun_radius_rad = (16.0 / 60.0) * (3.1415926535 / 180.0)
-        moon_radius_rad = (15.5 / 60.0) * (3.1415926535 / 180.0)
-        d = sep_rad
-        R = sun_radius_rad
-        r = moon_radius_rad
-        if d >= R + r:
-            return 0.0
-        if d <= abs(R - r):
-            covered = (3.1415926535 * (min(R, r) ** 2))
-            return round(100.0 * covered / (3.1415926535 * (R ** 2)), 1)
-        def clamp(x: float) -> float:
-            return max(-1.0, min(1.0, x))
-        alpha = 2 * acos(clamp((d * d + R * R - r * r) / (2 * d * R)))
-        beta = 2 * acos(clamp((d * d + r * r - R * R) / (2 * d * r)))
-        area = 0.5 * (R * R * (alpha - sin(alpha)) + r * r * (beta - sin(beta)))
-        return round(100.0 * area / (3.1415926535 * (R ** 2)), 1)
+        cov_now, _ = await self.hass.async_add_executor_job(self._compute_local_window_sync, when, None, lat, lon)
+        return cov_now
+
+    def _sky_context(self, lat: float, lon: float) -> Tuple[Any, Any, Any, Any]:
+        """Return (timescale, sun, moon, observer) for a location, building the observer once."""
+        ctx = self._sky_contexts.get((lat, lon))
+        if ctx is None or ctx[0] is not self._ephemeris:
+            ts, eph = self._ephemeris
+            observer = eph["earth"] + wgs84.latlon(latitude_degrees=lat, longitude_degrees=lon)
+            ctx = self._sky_contexts[(lat, lon)] = (self._ephemeris, ts, eph["sun"], eph["moon"], observer)
+        return ctx[1:]
+
+    def _find_local_maximum_sync(self, approx_when: datetime, lat: float, lon: float) -> Tuple[datetime, float]:
+        # Runs in executor thread; each pass is a single vectorized Skyfield evaluation
+        ts, sun, moon, observer = self._sky_context(lat, lon)
+        approx_tt = ts.from_datetime(approx_when).tt
+
+        def best_offset(offsets_min: "np.ndarray") -> Tuple[int, float]:
+            t = ts.tt_jd(approx_tt + offsets_min / 1440.0)
+            at = observer.at(t)
+            sep = at.observe(sun).apparent().separation_from(at.observe(moon).apparent()).radians
+            i = int(np.argmin(sep))
+            return int(offsets_min[i]), float(sep[i])
+
+        # Coarse: 10-min grid over +/-3h; refine: 1-min grid over +/-6 min around the coarse best
+        # (the true minimum is within half a coarse step of it)
+        best, min_sep = best_offset(np.arange(-180, 181, 10, dtype=float))
+        if min_sep > _NO_ECLIPSE_SEP_RAD:
+            # Not eclipsed here at any time; the refine pass cannot change the coverage
+            return approx_when + timedelta(minutes=best), 0.0
+        best, min_sep = best_offset(np.arange(best - 6, best + 7, 1, dtype=float))
+        return approx_when + timedelta(minutes=best), _coverage_percent(min_sep)
 
     async def async_find_local_maximum(self, approx_when: datetime, lat: float, lon: float) -> Optional[Tuple[datetime, float]]:
         if not (self.install_skyfield and SKYFIELD_AVAILABLE and self._ephemeris is not None):
             return None
-        ts, eph = self._ephemeris
-        earth = eph["earth"]
-        sun = eph["sun"]
-        moon = eph["moon"]
-        observer = earth + wgs84.latlon(latitude_degrees=lat, longitude_degrees=lon)
-
-        def separation(dt: datetime) -> float:
-            t = ts.from_datetime(dt)
-            a_s = observer.at(t).observe(sun).apparent()
-            a_m = observer.at(t).observe(moon).apparent()
-            return a_s.separation_from(a_m).radians
-
-        window = timedelta(hours=3)
-        step = timedelta(minutes=5)
-        start = approx_when - window
-        end = approx_when + window
-        num = int((end - start) / step) + 1
-        best_dt = approx_when
-        best_sep = separation(approx_when)
-        for i in range(num):
-            dt = start + i * step
-            sep = separation(dt)
-            if sep < best_sep:
-                best_sep = sep
-                best_dt = dt
-        refine_window = timedelta(minutes=10)
-        refine_step = timedelta(minutes=1)
-        start = best_dt - refine_window
-        end = best_dt + refine_window
-        num = int((end - start) / refine_step) + 1
-        for i in range(num):
-            dt = start + i * refine_step
-            sep = separation(dt)
-            if sep < best_sep:
-                best_sep = sep
-                best_dt = dt
-        coverage = await self.async_calculate_coverage_percent(best_dt, lat, lon)
-        if coverage is None:
-            return None
+        # Results depend only on the event time and the (rounded) location
+        cache = self._coverage_cache
+        key = f"{approx_when.isoformat()}|{lat:.3f}|{lon:.3f}"
+        hit = cache.get(key)
+        if hit is not None:
+            return datetime.fromisoformat(hit[0]), hit[1]
+        best_dt, coverage = await self.hass.async_add_executor_job(self._find_local_maximum_sync, approx_when, lat, lon)
+        cache[key] = [best_dt.isoformat(), coverage]
+        self._stores["coverage"].async_delay_save(lambda: cache, _STORE_SAVE_DELAY)
         return best_dt, coverage
 
+    async def async_get_local_attrs(self, event: EclipseEvent, lat: float, lon: float) -> dict[str, Any]:
+        """Return coverage, local maximum, contacts and duration for an event, computed once per day."""
+        key = (event.identifier, lat, lon, self.today_utc)
+        attrs = self._local_attrs_cache.get(key)
+        if attrs is not None:
+            return attrs
+        pending = self._local_attrs_pending.get(key)
+        if pending is None:
+            pending = self._local_attrs_pending[key] = self.hass.async_create_task(
+                self._async_compute_local_attrs(event, lat, lon)
+            )
+            pending.add_done_callback(lambda _: self._local_attrs_pending.pop(key, None))
+        attrs = await asyncio.shield(pending)
+        self._local_attrs_cache[key] = attrs
+        return attrs
+
+    async def _async_compute_local_attrs(self, event: EclipseEvent, lat: float, lon: float) -> dict[str, Any]:
+        cov_now = local = contacts = None
+        if self.install_skyfield and SKYFIELD_AVAILABLE and self._ephemeris is not None:
+            # Maximum usually comes from the coverage cache filled by the refresh scan;
+            # current coverage and contacts then share one ephemeris sweep
+            local = await self.async_find_local_maximum(event.date, lat, lon)
+            max_time = local[0] if local and local[1] > 0.0 else None
+            cov_now, contacts = await self.hass.async_add_executor_job(
+                self._compute_local_window_sync, event.date, max_time, lat, lon
+            )
+        duration = None
+        if contacts:
+            try:
+                duration = (contacts[1] - contacts[0]).total_seconds() / 60.0
+            except Exception:
+                duration = None
+        return {
+            "coverage": cov_now,
+            "local_max": local,
+            "contacts": contacts,
+            "duration": duration,
+        }
+
+    def _compute_local_window_sync(
+        self, when: datetime, max_time: Optional[datetime], lat: float, lon: float
+    ) -> Tuple[float, Optional[Tuple[datetime, datetime]]]:
+        """Coverage at `when` and, given the local maximum, the contact times on a 2-minute grid."""
+        # Runs in executor thread; a coarse pass (every 5th grid sample, plus the `when` instant)
+        # brackets both contacts, then one small pass resolves the grid samples inside the brackets
+        ts, sun, moon, observer = self._sky_context(lat, lon)
+
+        def separations(tt: "np.ndarray") -> "np.ndarray":
+            at = observer.at(ts.tt_jd(tt))
+            return at.observe(sun).apparent().separation_from(at.observe(moon).apparent()).radians
+
+        if max_time is None:
+            sep = separations(np.array([ts.from_datetime(when).tt]))
+            return _coverage_percent(float(sep[-1])), None
+        offsets_min = np.arange(-238, 239, 2, dtype=float)
+        last = len(offsets_min) - 1
+        center = last // 2
+        # Coarse lattice through the maximum, always including both ends of the grid
+        coarse = np.unique(np.concatenate(([0], np.arange(center % 5, last + 1, 5), [last])))
+        max_tt = ts.from_datetime(max_time).tt
+        sep = separations(np.append(max_tt + offsets_min[coarse] / 1440.0, ts.from_datetime(when).tt))
+        cov_now = _coverage_percent(float(sep[-1]))
+        visible = _coverage_percent_array(sep[:-1]) > 0.1
+        ci = int(np.searchsorted(coarse, center))
+        if not visible[ci]:
+            return cov_now, (max_time, max_time)
+        # Coarse samples around the maximum where the eclipse is no longer visible
+        before = np.flatnonzero(~visible[:ci])
+        after = np.flatnonzero(~visible[ci:])
+        lo = range(coarse[before[-1]] + 1, coarse[before[-1] + 1]) if before.size else range(0)
+        hi = range(coarse[ci + after[0] - 1] + 1, coarse[ci + after[0]]) if after.size else range(0)
+        start_idx = coarse[before[-1] + 1] if before.size else 0
+        end_idx = coarse[ci + after[0] - 1] if after.size else last
+        refine = np.array([*lo, *hi], dtype=int)
+        if refine.size:
+            fine_visible = _coverage_percent_array(separations(max_tt + offsets_min[refine] / 1440.0)) > 0.1
+            # First visible sample of the leading bracket, last visible sample of the trailing one
+            for idx, vis in zip(refine[: len(lo)], fine_visible[: len(lo)]):
+                if vis:
+                    start_idx = idx
+                    break
+            for idx, vis in zip(refine[len(lo):][::-1], fine_visible[len(lo):][::-1]):
+                if vis:
+                    end_idx = idx
+                    break
+        return cov_now, (
+            max_time + timedelta(minutes=float(offsets_min[start_idx])),
+            max_time + timedelta(minutes=float(offsets_min[end_idx])),
+        )
+
     async def async_find_contact_times(self, approx_when: datetime, lat: float, lon: float) -> Optional[Tuple[datetime, datetime]]:
         if not (self.install_skyfield and SKYFIELD_AVAILABLE and self._ephemeris is not None):
             return None
@@ -485,58 +976,12 @@ class EclipseCoordinator(DataUpdateCoordinator[List[EclipseEvent]]):
         local = await self.async_find_local_maximum(approx_when, lat, lon)
         if not local or local[1] <= 0.0:
             return None
-        ts, eph = self._ephemeris
-        earth = eph["earth"]
-        sun = eph["sun"]
-        moon = eph["moon"]
-        observer = earth + wgs84.latlon(latitude_degrees=lat, longitude_degrees=lon)
-
-        def coverage(dt: datetime) -> float:
-            t = ts.from_datetime(dt)
-            a_s = observer.at(t).observe(sun).apparent()
-            a_m = observer.at(t).observe(moon).apparent()
-            sep = a_s.separation_from(a_m).radians
-            R = (16.0 / 60.0) * (3.1415926535 / 180.0)
-            r = (15.5 / 60.0) * (3.1415926535 / 180.0)
-            if sep >= R + r:
-                return 0.0
-            if sep <= abs(R - r):
-                return 100.0 * (min(R, r) ** 2) / (R ** 2)
-            from math import acos, sin
-            def clamp(x: float) -> float:
-                return max(-1.0, min(1.0, x))
-            alpha = 2 * acos(clamp((sep * sep + R * R - r * r) / (2 * sep * R)))
-            beta = 2 * acos(clamp((sep * sep + r * r - R * R) / (2 * sep * r)))
-            area = 0.5 * (R * R * (alpha - sin(alpha)) + r * r * (beta - sin(beta)))
-            return 100.0 * area / (3.1415926535 * (R ** 2))
-
-        max_time = local[0]
-        # Search backward until coverage ~ 0%
-        start = max_time
-        t = max_time
-        step = timedelta(minutes=2)
-        limit = max_time - timedelta(hours=4)
-        while t > limit and coverage(t) > 0.1:
-            start = t
-            t -= step
-        # Search forward until coverage ~ 0%
-        end = max_time
-        t = max_time
-        limit = max_time + timedelta(hours=4)
-        while t < limit and coverage(t) > 0.1:
-            end = t
-            t += step
-        return (start, end)
-
+        _, contacts = await self.hass.async_add_executor_job(self._compute_local_window_sync, approx_when, local[0], lat, lon)
+        return contacts
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    install_skyfield: bool = entry.options.get("install_skyfield", entry.data.get("install_skyfield", True))
-    latitude: float = entry.options.get("latitude", entry.data.get("latitude", hass.config.latitude or 0.0))
-    longitude: float = entry.options.get("longitude", entry.data.get("longitude", hass.config.longitude or 0.0))
-    region: str = entry.options.get("region", entry.data.get("region", "Europe"))
-    num_events: int = entry.options.get("num_events", entry.data.get("num_events", DEFAULT_NUM_EVENTS))
-    update_hour: int = entry.options.get("update_hour", entry.data.get("update_hour", DEFAULT_UPDATE_HOUR))
-    min_coverage: int = entry.options.get("min_coverage", entry.data.get("min_coverage", DEFAULT_MIN_COVERAGE))
+    coordinator: EclipseCoordinator = hass.data[DOMAIN][entry.entry_id]
+    num_events: int = coordinator.num_events
 
     # Best-effort cleanup: remove stale Eclipse N sensors if num_events was reduced
     try:
@@ -555,14 +1000,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         # Ignore cleanup errors; entities can also be removed manually
         pass
 
-    coordinator = EclipseCoordinator(hass, install_skyfield, latitude, longitude, region, num_events, min_coverage)
-    # Load translations for current UI language (best effort)
-    ui_lang = getattr(hass.config, "language", None)
-    if isinstance(ui_lang, str) and ui_lang:
-        await coordinator.async_load_translations(ui_lang)
     entities: List[SensorEntity] = []
     for index in range(num_events):
-        entities.append(EclipseAggregateSensor(coordinator, entry, index, update_hour))
+        entities.append(EclipseAggregateSensor(coordinator, entry, index))
     # Days until next eclipse
     entities.append(EclipseDaysUntilSensor(coordinator, entry))
     # Setup status tracking
@@ -581,12 +1021,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 coordinator.logger.info("Loading Skyfield ephemeris and computing attributes...")
                 await coordinator._async_setup_skyfield()
                 if coordinator._ephemeris is not None:
-                    for entity in entities:
-                        if hasattr(entity, '_recompute'):
-                            try:
-                                await entity._recompute()
-                            except Exception as err:
-                                coordinator.logger.error("Skyfield recompute failed for %s: %s", entity.name, err)
+                    # Recompute all event sensors concurrently; they share the coordinator caches
+                    recompute = [entity for entity in entities if hasattr(entity, '_recompute')]
+                    results = await asyncio.gather(
+                        *(entity._recompute() for entity in recompute), return_exceptions=True
+                    )
+                    for entity, result in zip(recompute, results):
+                        if isinstance(result, Exception):
+                            coordinator.logger.error("Skyfield recompute failed for %s: %s", entity.name, result)
                     coordinator.logger.info("Background initialization completed with Skyfield attributes")
                 else:
                     coordinator.logger.warning("Skyfield setup incomplete - ephemeris failed to load")
@@ -606,13 +1048,7 @@ class EclipseBaseEntity(CoordinatorEntity[EclipseCoordinator], SensorEntity):
         super().__init__(coordinator)
         self.entry = entry
         self.index = index
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Solar Eclipse",
-            manufacturer="Eclipse predictions by NASA/GSFC",
-            model="Solar Eclipse Advanced",
-            sw_version=VERSION,
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def _event(self) -> Optional[EclipseEvent]:
@@ -626,7 +1062,7 @@ class EclipseAggregateSensor(EclipseBaseEntity):
     _attr_device_class = SensorDeviceClass.DATE
     _attr_should_poll = False
 
-    def __init__(self, coordinator: EclipseCoordinator, entry: ConfigEntry, index: int, update_hour: int) -> None:
+    def __init__(self, coordinator: EclipseCoordinator, entry: ConfigEntry, index: int) -> None:
         super().__init__(coordinator, entry, index)
         self._attr_unique_id = f"{entry.entry_id}_eclipse{index+1}_date"
         self._attr_name = f"Eclipse {index+1} Date"
@@ -638,11 +1074,13 @@ class EclipseAggregateSensor(EclipseBaseEntity):
         self._cached_start_local: Optional[datetime] = None
         self._cached_end_local: Optional[datetime] = None
         self._cached_duration_minutes: Optional[float] = None
-        self._unsub_midnight = None
-        self._update_hour = int(update_hour)
         # Throttling state
         self._last_recompute_day: Optional[date] = None
         self._last_event_identifier: Optional[str] = None
+        # Attribute dict, rebuilt lazily after the event or cached values change
+        self._attrs_cache: Optional[dict[str, Any]] = None
+        # True while every Skyfield-derived value above is None
+        self._cache_cleared = True
 
     @property
     def native_value(self) -> Any:
@@ -652,14 +1090,18 @@ class EclipseAggregateSensor(EclipseBaseEntity):
 
     @property
     def extra_state_attributes(self):
+        if self._attrs_cache is None:
+            self._attrs_cache = self._build_attributes()
+        return self._attrs_cache
+
+    def _build_attributes(self) -> dict[str, Any]:
         event = self._event
         # Build attributes in requested order: type, coverage, start_time, maximum_time, end_time, duration, region, source
         attrs = {}
         
         # 1. Type (if event present)
         if event:
-            translated_type = self.coordinator.translate_value("type", event.type)
-            attrs["type"] = _t_type(self.hass, translated_type)
+            attrs["type"] = event.type_translated
         # 2. Coverage (Skyfield-derived)
         if self.coordinator.install_skyfield and SKYFIELD_AVAILABLE and self._cached_local_max_coverage is not None:
             attrs["coverage"] = f"{self._cached_local_max_coverage:.1f}%"
@@ -673,12 +1115,9 @@ class EclipseAggregateSensor(EclipseBaseEntity):
         if event:
             tz = dt_util.get_time_zone(self.hass.config.time_zone)
             def fmt_time(dt_val):
-                if not dt_val:
-                    return None
-                try:
-                    return dt_val.astimezone(tz).strftime("%H:%M")
-                except Exception:
-                    return None
+                if isinstance(dt_val, datetime):
+                    return dt_val.astimezone(tz).strftime(_TIME_FMT)
+                return None
             # Prefer Skyfield-derived local contacts; fallback to dataset
             start_dt = self._cached_start_local if (self.coordinator.install_skyfield and SKYFIELD_AVAILABLE) else event.start
             max_dt = self._cached_local_max_time if (self.coordinator.install_skyfield and SKYFIELD_AVAILABLE) else event.date
@@ -699,8 +1138,7 @@ class EclipseAggregateSensor(EclipseBaseEntity):
             attrs["duration"] = f"{int(self._cached_duration_minutes)} min"
         
         # 7. Region
-        translated_region = self.coordinator.translate_value("region", self.coordinator.region)
-        attrs["region"] = _t_region(self.hass, translated_region)
+        attrs["region"] = self.coordinator.get_translated_region(self.hass)
         
         # 8. Source
         attrs["source"] = NASA_DECADE_URLS[0]
@@ -718,77 +1156,65 @@ class EclipseAggregateSensor(EclipseBaseEntity):
         # Try an immediate compute if ephemeris already loaded, otherwise wait for coordinator update
         if self.coordinator.install_skyfield and SKYFIELD_AVAILABLE and self.coordinator._ephemeris is not None:
             await self._recompute()
-        else:
+        elif self._reset_cache():
             # Ensure state is available even before heavy data
-            self._cached_coverage = None
-            self._cached_local_max_time = None
-            self._cached_local_max_coverage = None
-            self._cached_start_local = None
-            self._cached_end_local = None
-            self._cached_duration_minutes = None
             self.async_write_ha_state()
-        # Schedule daily recompute at configured hour
-        self._unsub_midnight = async_track_time_change(
-            self.hass, lambda now: self.hass.async_create_task(self._recompute()), hour=self._update_hour, minute=0, second=0
-        )
 
+    @callback
     def _handle_coordinator_update(self) -> None:
-        super()._handle_coordinator_update()
-        # When coordinator finishes first refresh and/or ephemeris loads, recompute attributes
-        if self.coordinator.install_skyfield and SKYFIELD_AVAILABLE and self.coordinator._ephemeris is not None:
-            self.hass.async_create_task(self._recompute())
-        else:
-            # Write base state so date updates propagate
-            self.async_write_ha_state()
-        
-        # Also update status sensor
+        # Also fired by the coordinator's daily update at the configured hour.
+        # Write base state right away so date updates propagate
+        self._attrs_cache = None
         self.async_write_ha_state()
+        # Recompute Skyfield attributes only when the event or the day changed
+        if self.coordinator.install_skyfield and SKYFIELD_AVAILABLE and self.coordinator._ephemeris is not None:
+            event = self._event
+            current_id = event.identifier if event else None
+            if self._last_recompute_day != self.coordinator.today_utc or self._last_event_identifier != current_id:
+                # Background task: a recompute must never hold up startup or shutdown
+                self.hass.async_create_background_task(self._recompute(), f"{DOMAIN}_recompute_{self._attr_unique_id}")
 
     async def async_will_remove_from_hass(self) -> None:
         await super().async_will_remove_from_hass()
-        if self._unsub_midnight:
-            self._unsub_midnight()
-            self._unsub_midnight = None
+        self._attrs_cache = None
+
+    def _reset_cache(self) -> bool:
+        """Clear the Skyfield-derived values; return True if any were set."""
+        if self._cache_cleared:
+            return False
+        self._cached_coverage = None
+        self._cached_local_max_time = None
+        self._cached_local_max_coverage = None
+        self._cached_start_local = None
+        self._cached_end_local = None
+        self._cached_duration_minutes = None
+        self._cache_cleared = True
+        self._attrs_cache = None
+        return True
 
     async def _recompute(self) -> None:
         event = self._event
-        # Throttle: if same event and already recomputed today, skip heavy work
-        today = datetime.now(timezone.utc).date()
+        today = self.coordinator.today_utc
         current_id = event.identifier if event else None
-        if (
-            self.coordinator.install_skyfield and SKYFIELD_AVAILABLE and self._last_recompute_day == today and self._last_event_identifier == current_id
-        ):
-            # Nothing changed; just write current state
-            self.async_write_ha_state()
-            return
-        if not event:
-            self._cached_coverage = None
-            self._cached_local_max_time = None
-            self._cached_local_max_coverage = None
-            self._cached_start_local = None
-            self._cached_end_local = None
-            self._cached_duration_minutes = None
+        if not event or not (self.coordinator.install_skyfield and SKYFIELD_AVAILABLE and self.coordinator._ephemeris is not None):
+            # Nothing to compute; write only if previously computed values were dropped
             self._last_recompute_day = today
-            self._last_event_identifier = None
-            self.async_write_ha_state()
+            self._last_event_identifier = current_id
+            if self._reset_cache():
+                self.async_write_ha_state()
             return
-        if not (self.coordinator.install_skyfield and SKYFIELD_AVAILABLE and self.coordinator._ephemeris is not None):
-            self._cached_coverage = None
-            self._cached_local_max_time = None
-            self._cached_local_max_coverage = None
-            self._cached_start_local = None
-            self._cached_end_local = None
-            self._cached_duration_minutes = None
-            self._last_recompute_day = today
-            self._last_event_identifier = event.identifier
+        # Throttle: if same event and already recomputed today, skip heavy work
+        if self._last_recompute_day == today and self._last_event_identifier == current_id:
+            # Nothing changed; just write current state
             self.async_write_ha_state()
             return
         lat = float(self.coordinator.latitude)
         lon = float(self.coordinator.longitude)
         self.coordinator.logger.debug("Computing Skyfield attributes for %s at %.4f,%.4f", event.identifier, lat, lon)
-        cov_now = await self.coordinator.async_calculate_coverage_percent(event.date, lat, lon)
-        local = await self.coordinator.async_find_local_maximum(event.date, lat, lon)
-        contacts = await self.coordinator.async_find_contact_times(event.date, lat, lon)
+        attrs = await self.coordinator.async_get_local_attrs(event, lat, lon)
+        cov_now = attrs["coverage"]
+        local = attrs["local_max"]
+        contacts = attrs["contacts"]
         self.coordinator.logger.debug("Skyfield results: coverage=%.2f%%, local_max_coverage=%.2f%%, contacts=%s", 
                                     cov_now or 0, local[1] if local else 0, contacts[0] if contacts else None)
         self._cached_coverage = cov_now
@@ -800,18 +1226,14 @@ class EclipseAggregateSensor(EclipseBaseEntity):
             self._cached_local_max_coverage = None
         if contacts:
             self._cached_start_local, self._cached_end_local = contacts
-            # Calculate duration in minutes
-            try:
-                duration_delta = self._cached_end_local - self._cached_start_local
-                self._cached_duration_minutes = duration_delta.total_seconds() / 60.0
-            except Exception:
-                self._cached_duration_minutes = None
         else:
             self._cached_start_local = None
             self._cached_end_local = None
-            self._cached_duration_minutes = None
+        self._cached_duration_minutes = attrs["duration"]
+        self._cache_cleared = False
         self._last_recompute_day = today
         self._last_event_identifier = event.identifier
+        self._attrs_cache = None
         self.async_write_ha_state()
 
 
@@ -824,13 +1246,7 @@ class EclipseSetupStatusSensor(CoordinatorEntity[EclipseCoordinator], SensorEnti
         super().__init__(coordinator)
         self.entry = entry
         self._attr_unique_id = f"{entry.entry_id}_setup_status"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Solar Eclipse",
-            manufacturer="Eclipse predictions by NASA/GSFC",
-            model="Solar Eclipse Advanced",
-            sw_version=VERSION,
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -860,22 +1276,11 @@ class EclipseDaysUntilSensor(CoordinatorEntity[EclipseCoordinator], SensorEntity
         super().__init__(coordinator)
         self.entry = entry
         self._attr_unique_id = f"{entry.entry_id}_days_until_next_eclipse"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Solar Eclipse",
-            manufacturer="Eclipse predictions by NASA/GSFC",
-            model="Solar Eclipse Advanced",
-            sw_version=VERSION,
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[int]:
-        data = self.coordinator.data or []
-        if not data:
-            return None
-        now = datetime.now(timezone.utc)
-        future = [e for e in data if e.date >= now]
-        if not future:
+        next_event = self.coordinator.next_event()
+        if next_event is None:
             return None
-        next_event = min(future, key=lambda e: e.date)
-        return max(0, (next_event.date.date() - now.date()).days)
+        return max(0, (next_event.date.date() - self.coordinator.today_utc).days)